@@ -1,7 +1,6 @@
 from __future__ import unicode_literals
 
 import unicodedata
-import re
 
 from .p3 import ustr, uchr
 
@@ -12,15 +11,14 @@ TYPE_KEY = 'type'
 CONTROL_CHARS = ''.join(map(uchr, list(range(0, 32)) + list(range(127, 160))))
 CITEKEY_FORBIDDEN_CHARS = '@\'\\,#}{~%/ '  # '/' is OK for bibtex but forbidden
 # here since we transform citekeys into filenames
-CITEKEY_EXCLUDE_RE = re.compile(
-    '[%s]' % re.escape(CONTROL_CHARS + CITEKEY_FORBIDDEN_CHARS))
+CITEKEY_EXCLUDE_TABLE = dict(
+    (ord(c), None) for c in CONTROL_CHARS + CITEKEY_FORBIDDEN_CHARS)
 
 
 def str2citekey(s):
-    key = unicodedata.normalize('NFKD', ustr(s)).encode('ascii', 'ignore').decode()
-    key = CITEKEY_EXCLUDE_RE.sub('', key)
-    # Normalize chars and remove non-ascii
-    return key
+    # Normalize chars, drop forbidden ones and remove non-ascii
+    key = unicodedata.normalize('NFKD', ustr(s))
+    return key.translate(CITEKEY_EXCLUDE_TABLE).encode('ascii', 'ignore').decode()
 
 
 def check_citekey(citekey):
@@ -48,7 +46,7 @@ def extract_citekey(bibdata):
 
 def author_last(author_str):
     """ Return the last name of the author """
-    return author_str.split(',')[0]
+    return author_str.partition(',')[0]
 
 
 def valid_citekey(citekey):
@@ -63,17 +61,12 @@ def generate_citekey(bibdata):
         :raise ValueError:  if no author nor editor is defined.
     """
     citekey, entry = get_entry(bibdata)
-    author_key = 'author' if 'author' in entry else 'editor'
-    try:
-        first_author = entry[author_key][0]
-    except KeyError:
+    authors = entry.get('author') or entry.get('editor')
+    if not authors:
         raise ValueError(
             "No author or editor defined: cannot generate a citekey.")
-    try:
-        year = entry['year']
-    except KeyError:
-        year = ''
-    citekey = '{}{}'.format(''.join(author_last(first_author)), year)
+    year = entry.get('year', '')
+    citekey = '{}{}'.format(author_last(authors[0]), year)
 
     return str2citekey(citekey)
 
@@ -84,22 +77,18 @@ def extract_docfile(bibdata, remove=False):
 
         :param remove: remove field after extracting information (default: False)
     """
-    try:
-        if 'file' in bibdata:
-            field = bibdata['file']
-            # Check if this is mendeley specific
-            for f in field.split(':'):
-                if len(f) > 0:
-                    break
-            if remove:
-                bibdata.pop('file')
-            # This is a hck for Mendeley. Make clean
-            if f[0] != '/':
-                f = '/' + f
-            return f
-        if 'attachments' in bibdata:
-            return bibdata['attachments']
-        if 'pdf' in bibdata:
-            return bibdata['pdf']
-    except (KeyError, IndexError):
-        return None
+    field = bibdata.get('file')
+    if field is not None:
+        if remove:
+            bibdata.pop('file')
+        # Check if this is mendeley specific: keep first non-empty path
+        f = field.lstrip(':').partition(':')[0]
+        if not f:
+            return None
+        # This is a hck for Mendeley. Make clean
+        return f if f[0] == '/' else '/' + f
+    if 'attachments' in bibdata:
+        return bibdata['attachments']
+    if 'pdf' in bibdata:
+        return bibdata['pdf']
+    return None
@@ -8,7 +8,6 @@ from .. import content
 from .. import repo
 from .. import paper
 from .. import templates
-from .. import apis
 from .. import pretty
 from .. import utils
 from .. import endecoder
@@ -73,6 +72,8 @@ def bibentry_from_editor(conf, ui):
 
 
 def bibentry_from_api(args, ui, raw=False):
+    # apis pulls requests, feedparser and bs4: only load them when needed
+    from .. import apis
     try:
         if args.doi is not None:
             return apis.get_bibentry_from_api(args.doi, 'doi', ui=ui, raw=raw)
@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 
 import os
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from .. import repo
 from .. import endecoder
@@ -11,11 +12,35 @@ from .. import content
 from ..paper import Paper
 from ..uis import get_ui
 from ..content import system_path, read_text_file
+from ..filebroker import BIB_EXT
 from ..command_utils import add_doc_copy_arguments
 
 
 _ABORT_USE_IGNORE_MSG = " Aborting import. Use --ignore-malformed to ignore."
 _IGNORING_MSG = " Ignoring it."
+_MAX_READ_THREADS = 16
+
+
+def _read_files(filepaths):
+    """Read text files, concurrently if there are several of them.
+
+    Only the (I/O bound) reading is done in threads: bibtex decoding is pure
+    python and would not benefit from it.
+    """
+    if len(filepaths) < 2:
+        return [read_text_file(filepath) for filepath in filepaths]
+    with ThreadPoolExecutor(min(_MAX_READ_THREADS, len(filepaths))) as pool:
+        return list(pool.map(read_text_file, filepaths))
+
+
+def _bibfiles_in_dir(dirpath):
+    """Return the paths of the bibfiles in a directory (not recursive)."""
+    try:
+        entries = os.scandir(dirpath)
+    except AttributeError:  # no scandir before Python 3.5
+        return [os.path.join(dirpath, f) for f in os.listdir(dirpath)
+                if f.endswith(BIB_EXT)]
+    return [e.path for e in entries if e.name.endswith(BIB_EXT) and e.is_file()]
 
 
 def parser(subparsers, conf):
@@ -54,15 +79,14 @@ def many_from_path(ui, bibpath, ignore=False):
 
     bibpath = system_path(bibpath)
     if os.path.isdir(bibpath):
-        all_files = [os.path.join(bibpath, f) for f in os.listdir(bibpath)
-                     if os.path.splitext(f)[-1][1:] == 'bib']
+        all_files = _bibfiles_in_dir(bibpath)
     else:
         all_files = [bibpath]
 
     biblist = []
-    for filepath in all_files:
+    for filepath, bibdata_raw in zip(all_files, _read_files(all_files)):
         try:
-            biblist.append(coder.decode_bibdata(read_text_file(filepath)))
+            biblist.append(coder.decode_bibdata(bibdata_raw))
         except coder.BibDecodingError:
             error = "Could not parse bibtex at {}.".format(filepath)
             if ignore:
@@ -72,8 +96,8 @@ def many_from_path(ui, bibpath, ignore=False):
                 ui.exit()
 
     papers = {}
-    for b in biblist:
-        for k, b in b.items():
+    for bibentry in biblist:
+        for k, b in bibentry.items():
             if k in papers:
                 ui.warning('Duplicated citekey {}. Keeping the last one.'.format(k))
             try:
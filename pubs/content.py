@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 
 import sys
 import os
+import stat
 import shutil
 
 from .p3 import urlparse, HTTPConnection, urlopen
@@ -27,17 +28,21 @@ class UnableToDecodeTextFile(Exception):
 
 # files i/o
 
-def _check_system_path_exists(path, fail=True):
-    answer = os.path.exists(path)
-    if not answer and fail:
-        raise IOError('File does not exist: {}'.format(path))
-    else:
-        return answer
+_STAT_CHECKS = {'isfile': stat.S_ISREG, 'isdir': stat.S_ISDIR}
 
 
 def _check_system_path_is(nature, path, fail=True):
-    check_fun = getattr(os.path, nature)
-    answer = check_fun(path)
+    """Check that path exists and is a file ('isfile') or dir ('isdir').
+
+    Relies on a single stat call rather than os.path.exists + os.path.isfile.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        if fail:
+            raise IOError('File does not exist: {}'.format(path))
+        return False
+    answer = _STAT_CHECKS[nature](mode)
     if not answer and fail:
         raise IOError('{} is not a {}.'.format(path, nature))
     else:
@@ -57,14 +62,12 @@ def _open(path, mode):
 
 def check_file(path, fail=True):
     syspath = system_path(path)
-    return (_check_system_path_exists(syspath, fail=fail) and
-            _check_system_path_is('isfile', syspath, fail=fail))
+    return _check_system_path_is('isfile', syspath, fail=fail)
 
 
 def check_directory(path, fail=True):
     syspath = system_path(path)
-    return (_check_system_path_exists(syspath, fail=fail) and
-            _check_system_path_is('isdir', syspath, fail=fail))
+    return _check_system_path_is('isdir', syspath, fail=fail)
 
 
 def read_text_file(filepath, fail=True):
@@ -29,7 +29,8 @@ class CacheEntrySet(object):
         self._entries = None
         self.modified = False
         # does the filesystem supports subsecond stat time?
-        self.nsec_support = os.stat('.').st_mtime != int(os.stat('.').st_mtime)
+        mtime = os.stat('.').st_mtime
+        self.nsec_support = mtime != int(mtime)
 
     @property
     def entries(self):
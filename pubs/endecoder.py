@@ -96,9 +96,9 @@ class EnDecoder(object):
     def encode_bibdata(self, bibdata, ignore_fields=[]):
         """Encode bibdata """
         bpdata = bp.bibdatabase.BibDatabase()
-        bpdata.entries = [self._entry_to_bp_entry(k, copy.copy(bibdata[k]),
+        bpdata.entries = [self._entry_to_bp_entry(k, copy.copy(entry),
                                                   ignore_fields=ignore_fields)
-                          for k in bibdata]
+                          for k, entry in bibdata.items()]
         return self.bwriter.write(bpdata)
 
     def _entry_to_bp_entry(self, key, entry, ignore_fields=[]):
@@ -132,17 +132,16 @@ class EnDecoder(object):
                 bibdata, common_strings=True, customization=customizations,
                 homogenize_fields=True).get_entry_dict()
             # Remove id from bibtexparser attribute which is stored as citekey
-            for e in entries:
-                entries[e].pop(BP_ID_KEY)
+            for entry in entries.values():
+                entry.pop(BP_ID_KEY)
                 # Convert bibtexparser entrytype key to internal 'type'
-                t = entries[e].pop(BP_ENTRYTYPE_KEY)
-                entries[e][TYPE_KEY] = t
+                entry[TYPE_KEY] = entry.pop(BP_ENTRYTYPE_KEY)
                 # Temporary fix to #188 (to be fully fixed when the upstream
                 # issue: sciunto-org/python-bibtexparser/#229 is fixed too)
-                if 'editor' in entries[e]:
-                    entries[e]['editor'] = [
+                if 'editor' in entry:
+                    entry['editor'] = [
                         editor['name'] if isinstance(editor, dict) else editor
-                        for editor in entries[e]['editor']]
+                        for editor in entry['editor']]
             if len(entries) > 0:
                 return entries
             else:
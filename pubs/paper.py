@@ -1,5 +1,4 @@
 import copy
-from dateutil.parser import parse as datetime_parse
 
 from bibtexparser.customization import convert_to_unicode
 
@@ -7,14 +6,16 @@ from . import bibstruct
 from .p3 import ustr
 
 
-DEFAULT_META = {'docfile': None, 'tags': set()}
+DEFAULT_META = {'docfile': None, 'tags': frozenset()}
 
 
 def _clean_metadata(metadata):
-    meta = copy.deepcopy(DEFAULT_META)
+    meta = dict(DEFAULT_META)  # shallow is enough: defaults are immutable
     meta.update(metadata or {})  # handles None metadata
     meta['tags'] = set(meta.get('tags', []))  # tags should be a set
     if 'added' in meta and isinstance(meta['added'], ustr):
+        # rarely needed (yaml already decodes dates): import only then
+        from dateutil.parser import parse as datetime_parse
         meta['added'] = datetime_parse(meta['added'])
     return meta
 
@@ -30,6 +31,8 @@ class Paper(object):
         in a pythonic manner.
     """
 
+    __slots__ = ('citekey', 'metadata', 'bibdata')
+
     def __init__(self, citekey, bibdata, metadata=None):
         self.citekey = citekey
         self.metadata = _clean_metadata(metadata)
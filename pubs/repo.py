@@ -65,8 +65,9 @@ class Repository(object):
 
     # papers
     def all_papers(self):
+        # citekeys come from the bibfiles listing: no need to check existence
         for key in self.citekeys:
-            yield self.pull_paper(key)
+            yield self._pull_paper(key)
 
     def citekeys_from_prefix(self, prefix):
         """Return all citekey beginning with prefix."""
@@ -76,13 +77,16 @@ class Repository(object):
     def pull_paper(self, citekey):
         """Load a paper by its citekey from disk, if necessary."""
         if citekey in self:
-            return Paper.from_bibentry(
-                self.databroker.pull_bibentry(citekey),
-                citekey=citekey,
-                metadata=self.databroker.pull_metadata(citekey))
+            return self._pull_paper(citekey)
         else:
             raise CiteKeyNotFound(citekey)
 
+    def _pull_paper(self, citekey):
+        return Paper.from_bibentry(
+            self.databroker.pull_bibentry(citekey),
+            citekey=citekey,
+            metadata=self.databroker.pull_metadata(citekey))
+
     def push_paper(self, paper, overwrite=False, event=True):
         """ Push a paper to disk
 
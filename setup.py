@@ -47,7 +47,8 @@ setup(
     include_package_data=True,
 
     install_requires=['pyyaml', 'bibtexparser>=1.0', 'python-dateutil', 'six',
-                      'requests', 'configobj', 'beautifulsoup4', 'feedparser'],
+                      'requests', 'configobj', 'beautifulsoup4', 'feedparser',
+                      'futures; python_version < "3"'],
     extras_require={'autocompletion': ['argcomplete'],
                     },
 
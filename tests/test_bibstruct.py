@@ -10,6 +10,27 @@ from pubs import bibstruct
 import fixtures
 
 
+class TestStr2Citekey(unittest.TestCase):
+
+    def test_removes_forbidden_chars(self):
+        self.assertEqual(bibstruct.str2citekey("D@o'e\\,#}{~%/ 2013"),
+                         'Doe2013')
+
+    def test_removes_control_chars(self):
+        self.assertEqual(bibstruct.str2citekey('Doe\t\n\x7f\x9f2013'),
+                         'Doe2013')
+
+    def test_strips_accents(self):
+        self.assertEqual(bibstruct.str2citekey('Zôuéï2013'), 'Zouei2013')
+
+    def test_drops_non_ascii(self):
+        self.assertEqual(bibstruct.str2citekey('Doe\u4e2d2013'), 'Doe2013')
+
+    def test_keeps_allowed_punctuation(self):
+        self.assertEqual(bibstruct.str2citekey('doe-smith_2013:a.b'),
+                         'doe-smith_2013:a.b')
+
+
 class TestGenerateCitekey(unittest.TestCase):
 
     def test_fails_on_empty_paper(self):
@@ -23,6 +44,29 @@ class TestGenerateCitekey(unittest.TestCase):
         key = bibstruct.generate_citekey(doe_bibentry)
         self.assertEqual(key, 'Zou2013')
 
+    def test_fails_without_author_nor_editor(self):
+        bibentry = copy.deepcopy(fixtures.doe_bibentry)
+        citekey, bibdata = bibstruct.get_entry(bibentry)
+        bibdata.pop('author')
+        with self.assertRaises(ValueError):
+            bibstruct.generate_citekey(bibentry)
+        bibdata['author'] = []
+        with self.assertRaises(ValueError):
+            bibstruct.generate_citekey(bibentry)
+
+    def test_uses_editor(self):
+        bibentry = copy.deepcopy(fixtures.doe_bibentry)
+        citekey, bibdata = bibstruct.get_entry(bibentry)
+        bibdata.pop('author')
+        bibdata['editor'] = ['Smith, Jane']
+        self.assertEqual(bibstruct.generate_citekey(bibentry), 'Smith2013')
+
+    def test_no_year(self):
+        bibentry = copy.deepcopy(fixtures.doe_bibentry)
+        citekey, bibdata = bibstruct.get_entry(bibentry)
+        bibdata.pop('year')
+        self.assertEqual(bibstruct.generate_citekey(bibentry), 'Doe')
+
     def test_simple(self):
         bibentry = copy.deepcopy(fixtures.doe_bibentry)
         key = bibstruct.generate_citekey(bibentry)
@@ -33,5 +77,34 @@ class TestGenerateCitekey(unittest.TestCase):
         self.assertEqual(key, 'Salinger1961')
 
 
+class TestExtractDocfile(unittest.TestCase):
+
+    def test_no_docfile(self):
+        self.assertIsNone(bibstruct.extract_docfile({'title': 'Nice Title'}))
+
+    def test_file(self):
+        self.assertEqual(bibstruct.extract_docfile({'file': '/path/doe.pdf'}),
+                         '/path/doe.pdf')
+
+    def test_mendeley_file(self):
+        bibdata = {'file': ':path/doe.pdf:pdf'}
+        self.assertEqual(bibstruct.extract_docfile(bibdata), '/path/doe.pdf')
+
+    def test_empty_file(self):
+        self.assertIsNone(bibstruct.extract_docfile({'file': ''}))
+        self.assertIsNone(bibstruct.extract_docfile({'file': '::'}))
+
+    def test_remove(self):
+        bibdata = {'file': '/path/doe.pdf', 'title': 'Nice Title'}
+        bibstruct.extract_docfile(bibdata, remove=True)
+        self.assertEqual(bibdata, {'title': 'Nice Title'})
+
+    def test_attachments_and_pdf(self):
+        self.assertEqual(bibstruct.extract_docfile({'attachments': 'doe.pdf'}),
+                         'doe.pdf')
+        self.assertEqual(bibstruct.extract_docfile({'pdf': 'doe.pdf'}),
+                         'doe.pdf')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import unittest
+import datetime
 
 import dotdot
 import fixtures
@@ -44,6 +45,17 @@ class TestAttributes(unittest.TestCase):
         self.assertEqual(self.p.tags, set())
         self.p.remove_tag('ranking')
 
+    def test_default_tags_not_shared(self):
+        p1 = Paper('Doe2013', fixtures.doe_bibdata)
+        p2 = Paper('Doe2013b', fixtures.doe_bibdata)
+        p1.add_tag('algorithm')
+        self.assertEqual(p2.tags, set())
+
+    def test_added_parsed_from_string(self):
+        p = Paper('Doe2013', fixtures.doe_bibdata,
+                  metadata={'added': '2013-03-01 12:30:00'})
+        self.assertEqual(p.added, datetime.datetime(2013, 3, 1, 12, 30))
+
     def test_fails_with_empty_citekey(self):
         with self.assertRaises(ValueError):
             Paper(" ", fixtures.doe_bibdata)